@@ -1,19 +1,56 @@
 from __future__ import annotations
 
 import argparse
-import json
+import sys
+from collections.abc import Callable
+from functools import cache
+from typing import TYPE_CHECKING
+
+import orjson
+
 from model_service.config import AdapterRuntimeSettings, Settings, load_settings
-from model_service.contracts import coerce_input
-from model_service.eval.runner import DatasetQualityReport, evaluate, load_jsonl, validate_dataset
-from model_service.model.stub import StubAdapter
-from model_service.service.pipeline import run
 
+# Subcommands import their own dependencies (pydantic, eval runner, pipeline) on demand,
+# so `--help` and argument errors don't pay for them.
+if TYPE_CHECKING:
+    from model_service.eval.runner import DatasetQualityReport
+    from model_service.model.base import ModelAdapter
+
+
+def _emit(obj: object, indent: bool = False) -> None:
+    # orjson produces UTF-8 bytes (and serializes dataclasses natively); write them
+    # straight through instead of building an intermediate dict and decoding for print().
+    option = orjson.OPT_INDENT_2 if indent else 0
+    data = orjson.dumps(obj, option=option) + b"\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # Text-only stdout (e.g. redirect_stdout(io.StringIO())): no byte layer to write to.
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def _stub_adapter() -> ModelAdapter:
+    from model_service.model.stub import StubAdapter
 
-def _get_adapter(name: str):
-    # Expand later: hosted adapter, local model adapter, etc.
-    if name == "stub":
-        return StubAdapter()
-    raise SystemExit(f"Unknown adapter: {name!r}")
+    return StubAdapter()
+
+
+# Expand later: hosted adapter, local model adapter, etc.
+_ADAPTERS: dict[str, Callable[[], ModelAdapter]] = {
+    "stub": _stub_adapter,
+}
+
+
+@cache
+def _get_adapter(name: str) -> ModelAdapter:
+    # One instance per name, so the pipeline's per-adapter limits persist across calls.
+    factory = _ADAPTERS.get(name)
+    if factory is None:
+        raise SystemExit(f"Unknown adapter: {name!r}")
+    return factory()
 
 
 def _adapter_runtime(settings: Settings, name: str) -> AdapterRuntimeSettings:
@@ -22,9 +59,12 @@ def _adapter_runtime(settings: Settings, name: str) -> AdapterRuntimeSettings:
 
 
 def cmd_predict(args: argparse.Namespace) -> int:
+    from model_service.contracts import coerce_text_input
+    from model_service.service.pipeline import run
+
     settings = load_settings()
     model = _get_adapter(settings.adapter)
-    x = coerce_input({"text": args.text})
+    x = coerce_text_input(args.text)
     runtime_settings = _adapter_runtime(settings, settings.adapter)
     y = run(
         model,
@@ -32,13 +72,14 @@ def cmd_predict(args: argparse.Namespace) -> int:
         timeout_s=args.timeout_s or settings.default_timeout_s,
         runtime_settings=runtime_settings,
     )
-    print(json.dumps(y.model_dump(), ensure_ascii=False))
+    _emit(y.model_dump())
     return 0
 
 
 def cmd_validate(args: argparse.Namespace) -> int:
-    rows = load_jsonl(args.dataset)
-    report = validate_dataset(rows)
+    from model_service.eval.runner import iter_jsonl, validate_dataset
+
+    report = validate_dataset(iter_jsonl(args.dataset))
     _print_quality_report(report)
     if report.invalid_rows == 0:
         return 0
@@ -46,19 +87,50 @@ def cmd_validate(args: argparse.Namespace) -> int:
 
 
 def cmd_eval(args: argparse.Namespace) -> int:
+    from model_service.eval.runner import StopConditions, evaluate
+
     settings = load_settings()
     model = _get_adapter(settings.adapter)
     runtime_settings = _adapter_runtime(settings, settings.adapter)
+    stop_conditions = None
+    if args.stop_success_rate is not None:
+        stop_conditions = StopConditions(
+            success_rate_lt=args.stop_success_rate,
+            min_samples=args.stop_min_samples,
+        )
     report = evaluate(
         model,
         args.dataset,
         timeout_s=args.timeout_s or settings.default_timeout_s,
         runtime_settings=runtime_settings,
+        stop_conditions=stop_conditions,
+        concurrency=args.concurrency,
+        burst_size=args.burst_size,
     )
-    print(json.dumps(report.__dict__, indent=2))
+    _emit(report, indent=True)
     return 0
 
 
+def _positive_int(value: str) -> int:
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {n}")
+    return n
+
+
+def _unit_float(value: str) -> float:
+    try:
+        x = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid float value: {value!r}") from None
+    if not 0.0 <= x <= 1.0:
+        raise argparse.ArgumentTypeError(f"must be between 0 and 1, got {x}")
+    return x
+
+
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="model-service", add_help=True)
     sub = p.add_subparsers(dest="cmd", required=True)
@@ -75,13 +147,37 @@ def build_parser() -> argparse.ArgumentParser:
     p_eval = sub.add_parser("eval", help="Run evaluation over a dataset")
     p_eval.add_argument("--dataset", required=True)
     p_eval.add_argument("--timeout-s", type=float, default=None)
+    p_eval.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=None,
+        help="Eval worker threads (defaults to the adapter's max_concurrency)",
+    )
+    p_eval.add_argument(
+        "--burst-size",
+        type=_positive_int,
+        default=None,
+        help="Rows submitted per burst (defaults to 4x concurrency)",
+    )
+    p_eval.add_argument(
+        "--stop-success-rate",
+        type=_unit_float,
+        default=None,
+        help="Stop early once the running success rate drops below this value",
+    )
+    p_eval.add_argument(
+        "--stop-min-samples",
+        type=_positive_int,
+        default=50,
+        help="Rows to score before --stop-success-rate is checked",
+    )
     p_eval.set_defaults(fn=cmd_eval)
 
     return p
 
 
 def _print_quality_report(report: DatasetQualityReport) -> None:
-    print(json.dumps({"dataset_quality": report.as_dict()}, indent=2))
+    _emit({"dataset_quality": report}, indent=True)
 
 
 def main(argv: list[str] | None = None) -> int:
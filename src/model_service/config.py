@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import json
 import os
 from typing import Any
@@ -13,6 +14,7 @@ class AdapterRuntimeSettings:
     retry_attempts: int = 1
     retry_backoff_base_s: float = 0.1
     retry_jitter_s: float = 0.05
+    cache_enabled: bool = False
 
 
 def _parse_adapter_settings(raw: dict[str, Any]) -> AdapterRuntimeSettings:
@@ -41,11 +43,11 @@ def _parse_adapter_settings(raw: dict[str, Any]) -> AdapterRuntimeSettings:
         retry_attempts=retry_attempts,
         retry_backoff_base_s=_float_or_none(raw.get("retry_backoff_base_s")) or 0.1,
         retry_jitter_s=_float_or_none(raw.get("retry_jitter_s")) or 0.05,
+        cache_enabled=raw.get("cache_enabled") is True,
     )
 
 
-def _load_adapter_overrides() -> dict[str, AdapterRuntimeSettings]:
-    raw = os.getenv("MODEL_SERVICE_ADAPTER_SETTINGS")
+def _load_adapter_overrides(raw: str | None) -> dict[str, AdapterRuntimeSettings]:
     if not raw:
         return {}
     try:
@@ -72,8 +74,7 @@ class Settings:
     adapter_overrides: dict[str, AdapterRuntimeSettings]
 
 
-def _float_env(key: str, default: float, min_value: float | None = None) -> float:
-    raw = os.getenv(key)
+def _parse_float(raw: str | None, default: float, min_value: float | None = None) -> float:
     if raw is None:
         return default
     try:
@@ -85,9 +86,19 @@ def _float_env(key: str, default: float, min_value: float | None = None) -> floa
     return value
 
 
-def load_settings() -> Settings:
+@lru_cache(maxsize=1)
+def _settings_from_env(timeout_raw: str | None, adapter: str, overrides_raw: str | None) -> Settings:
     return Settings(
-        default_timeout_s=_float_env("MODEL_SERVICE_TIMEOUT_S", 2.0, min_value=0.0),
-        adapter=os.getenv("MODEL_SERVICE_ADAPTER", "stub"),
-        adapter_overrides=_load_adapter_overrides(),
+        default_timeout_s=_parse_float(timeout_raw, 2.0, min_value=0.0),
+        adapter=adapter,
+        adapter_overrides=_load_adapter_overrides(overrides_raw),
+    )
+
+
+def load_settings() -> Settings:
+    # Parsing is cached on the raw env strings, so a changed env is picked up on the next call.
+    return _settings_from_env(
+        os.getenv("MODEL_SERVICE_TIMEOUT_S"),
+        os.getenv("MODEL_SERVICE_ADAPTER", "stub"),
+        os.getenv("MODEL_SERVICE_ADAPTER_SETTINGS"),
     )
@@ -1,32 +1,64 @@
 from __future__ import annotations
 
-import json
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 
+import orjson
 from pydantic import ValidationError
 
 from model_service.contracts import (
     INPUT_SCHEMA_VERSION,
     LANGUAGE_WHITELIST,
     REQUIRED_METADATA_KEYS,
+    InputContract,
     coerce_input,
 )
 from model_service.model.base import ModelAdapter
 from model_service.config import AdapterRuntimeSettings
 from model_service.service.pipeline import run
 
+# Used when neither the caller nor the adapter settings pick a concurrency.
+DEFAULT_EVAL_WORKERS = 8
+# Rows submitted per burst, as a multiple of the worker count, when burst_size is not given.
+DEFAULT_BURST_PER_WORKER = 4
 
-@dataclass(frozen=True)
+_READ_BUFFER_BYTES = 1 << 20
+
+# ValidationError locations that map onto DatasetQualityReport error counters.
+_LOC_TO_CATEGORY: dict[tuple, str] = {
+    ("schema_version",): "schema_version",
+    ("language",): "language",
+    ("metadata",): "metadata",
+}
+
+
+@dataclass(frozen=True, slots=True)
 class EvalReport:
     total: int
     ok: int
     failed: int
     p50_ms: float
     p95_ms: float
+    stopped_early: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class StopConditions:
+    # Abort once at least min_samples rows have been scored and ok/scored < success_rate_lt.
+    success_rate_lt: float | None = None
+    min_samples: int = 50
 
+    def should_stop(self, ok: int, scored: int) -> bool:
+        if self.success_rate_lt is None or scored < max(1, self.min_samples):
+            return False
+        return ok / scored < self.success_rate_lt
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class DatasetQualityReport:
     total_rows: int
     valid_rows: int
@@ -46,74 +78,98 @@ class DatasetQualityReport:
         }
 
 
-def _percentile(values: list[float], p: float) -> float:
+def _percentiles(values: Sequence[float], ps: tuple[float, ...]) -> list[float]:
+    # One sort shared by every requested percentile (nearest-rank on the sorted values).
     if not values:
-        return 0.0
+        return [0.0 for _ in ps]
     s = sorted(values)
-    idx = int(round((p / 100.0) * (len(s) - 1)))
-    return float(s[idx])
+    last = len(s) - 1
+    return [float(s[int(round((p / 100.0) * last))]) for p in ps]
 
 
-def load_jsonl(path: str | Path) -> list[dict]:
+def iter_jsonl(path: str | Path) -> Iterator[dict]:
+    # Binary reads + orjson: no text decoding layer, and nothing held beyond the current line.
     p = Path(path)
-    rows: list[dict] = []
-    with p.open("r", encoding="utf-8") as f:
+    with p.open("rb", buffering=_READ_BUFFER_BYTES) as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            if not line.strip():
                 continue
-            rows.append(json.loads(line))
-    return rows
+            yield orjson.loads(line)
 
 
-def validate_dataset(rows: list[dict]) -> DatasetQualityReport:
-    schema_version_errors = 0
-    language_errors = 0
-    metadata_errors = 0
-    valid_rows = 0
+def load_jsonl(path: str | Path) -> list[dict]:
+    return list(iter_jsonl(path))
+
 
+class _QualityTally:
+    """Running counters behind DatasetQualityReport, shared by validate_dataset and evaluate."""
+
+    def __init__(self) -> None:
+        self.total_rows = 0
+        self.valid_rows = 0
+        self.errors = {"schema_version": 0, "language": 0, "metadata": 0}
+
+    def add(self, valid: bool, error_categories: list[str]) -> None:
+        self.total_rows += 1
+        if valid:
+            self.valid_rows += 1
+        for category in error_categories:
+            self.errors[category] += 1
+
+    @property
+    def invalid_rows(self) -> int:
+        return self.total_rows - self.valid_rows
+
+    def report(self) -> DatasetQualityReport:
+        return DatasetQualityReport(
+            total_rows=self.total_rows,
+            valid_rows=self.valid_rows,
+            invalid_rows=self.invalid_rows,
+            schema_version_errors=self.errors["schema_version"],
+            language_errors=self.errors["language"],
+            metadata_errors=self.errors["metadata"],
+        )
+
+
+def _iter_validated(rows: Iterable[dict]) -> Iterator[tuple[InputContract | None, list[str]]]:
+    """Yield (contract, error_categories) per row; contract is None when the row is invalid."""
     for row in rows:
         # Required metadata/language presence checks before schema validation
-        row_invalid = False
+        categories: list[str] = []
         lang = row.get("language")
         if lang is None or lang not in LANGUAGE_WHITELIST:
-            language_errors += 1
-            row_invalid = True
+            categories.append("language")
 
         metadata = row.get("metadata")
         if not isinstance(metadata, dict) or REQUIRED_METADATA_KEYS.difference(metadata):
-            metadata_errors += 1
-            row_invalid = True
+            categories.append("metadata")
 
-        if row_invalid:
+        if categories:
+            yield None, categories
             continue
 
         try:
-            coerce_input(row)
-            valid_rows += 1
+            x = coerce_input(row)
         except ValidationError as e:
-            for err in e.errors():
-                if err.get("loc") == ("schema_version",):
-                    schema_version_errors += 1
-                elif err.get("loc") == ("language",):
-                    language_errors += 1
-                elif err.get("loc") == ("metadata",):
-                    metadata_errors += 1
+            # Only loc is read; skip building urls, ctx and input echoes for every error.
+            for err in e.errors(include_url=False, include_context=False, include_input=False):
+                category = _LOC_TO_CATEGORY.get(err["loc"])
+                if category is not None:
+                    categories.append(category)
             # If we miss specific categorization, still count the row as invalid
+            yield None, categories
         except Exception:
             # Non-ValidationError should still count as invalid
-            pass
-
-    total_rows = len(rows)
-    invalid_rows = total_rows - valid_rows
-    return DatasetQualityReport(
-        total_rows=total_rows,
-        valid_rows=valid_rows,
-        invalid_rows=invalid_rows,
-        schema_version_errors=schema_version_errors,
-        language_errors=language_errors,
-        metadata_errors=metadata_errors,
-    )
+            yield None, categories
+        else:
+            yield x, categories
+
+
+def validate_dataset(rows: Iterable[dict]) -> DatasetQualityReport:
+    tally = _QualityTally()
+    for x, categories in _iter_validated(rows):
+        tally.add(x is not None, categories)
+    return tally.report()
 
 
 def evaluate(
@@ -121,10 +177,67 @@ def evaluate(
     dataset_path: str | Path,
     timeout_s: float,
     runtime_settings: AdapterRuntimeSettings | None = None,
+    stop_conditions: StopConditions | None = None,
+    concurrency: int | None = None,
+    burst_size: int | None = None,
 ) -> EvalReport:
-    rows = load_jsonl(dataset_path)
-    quality_report = validate_dataset(rows)
-    if quality_report.invalid_rows:
+    for name, value in (("concurrency", concurrency), ("burst_size", burst_size)):
+        if value is not None and value < 1:
+            raise ValueError(f"{name} must be a positive integer, got {value}")
+
+    tally = _QualityTally()
+
+    def _valid_inputs() -> Iterator[InputContract]:
+        # Single pass: each row is validated once and handed to the model right away.
+        # Once any row fails the run is going to be rejected, so stop issuing model calls
+        # but keep validating to report complete counts.
+        for x, categories in _iter_validated(iter_jsonl(dataset_path)):
+            tally.add(x is not None, categories)
+            if x is not None and not tally.invalid_rows:
+                yield x
+
+    # Packed doubles: 8 bytes per row instead of a boxed float plus a list slot.
+    latencies = array("d")
+    ok = 0
+    stopped_early = False
+
+    def _score_one(x: InputContract):
+        return run(model, x, timeout_s=timeout_s, runtime_settings=runtime_settings)
+
+    # Rows are independent and only aggregates are reported, so I/O-bound adapters
+    # can be driven concurrently. The pipeline still enforces the adapter's
+    # max_concurrency and rate_limit_per_second on every call.
+    workers = (
+        concurrency
+        or (runtime_settings.max_concurrency if runtime_settings else None)
+        or DEFAULT_EVAL_WORKERS
+    )
+    burst = burst_size or workers * DEFAULT_BURST_PER_WORKER
+    inputs = _valid_inputs()
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        # Submit one burst at a time so in-flight work (and memory) stays bounded
+        # regardless of dataset size.
+        while not stopped_early:
+            batch = list(islice(inputs, burst))
+            if not batch:
+                break
+            results = ex.map(_score_one, batch)
+            for y in results:
+                latencies.append(y.latency_ms or 0.0)
+                ok += y.ok  # bool adds as 0/1; failures are derived from the row count
+                if stop_conditions is not None and stop_conditions.should_stop(ok, len(latencies)):
+                    stopped_early = True
+                    break
+            # Closing the map iterator cancels every model call that has not started yet.
+            results.close()
+
+    # Finish validating the remaining rows (no model calls) so an invalid dataset is
+    # still rejected after an early stop.
+    for _ in inputs:
+        pass
+
+    if tally.invalid_rows:
+        quality_report = tally.report()
         raise ValueError(
             "dataset failed quality checks: "
             f"{quality_report.invalid_rows} invalid of {quality_report.total_rows} "
@@ -133,23 +246,14 @@ def evaluate(
             f"metadata_errors={quality_report.metadata_errors}, "
             f"expected_schema_version={INPUT_SCHEMA_VERSION})"
         )
-    latencies: list[float] = []
-    ok = 0
-    failed = 0
-
-    for row in rows:
-        x = coerce_input(row)
-        y = run(model, x, timeout_s=timeout_s, runtime_settings=runtime_settings)
-        latencies.append(float(y.latency_ms or 0.0))
-        if y.ok:
-            ok += 1
-        else:
-            failed += 1
 
+    total = len(latencies)
+    p50_ms, p95_ms = _percentiles(latencies, (50, 95))
     return EvalReport(
-        total=len(rows),
+        total=total,
         ok=ok,
-        failed=failed,
-        p50_ms=_percentile(latencies, 50),
-        p95_ms=_percentile(latencies, 95),
+        failed=total - ok,
+        p50_ms=p50_ms,
+        p95_ms=p95_ms,
+        stopped_early=stopped_early,
     )
@@ -9,4 +9,5 @@ class ModelAdapter(Protocol):
     @property
     def model_version(self) -> str: ...
 
+    # Must return a new OutputContract per call: the pipeline sets latency_ms on it.
     def predict(self, x: InputContract) -> OutputContract: ...
@@ -1,22 +1,39 @@
 from __future__ import annotations
 
+import os
 import time
 from model_service.contracts import InputContract, OutputContract
 
 
+def _sleep_s_from_env() -> float:
+    # MODEL_SERVICE_STUB_SLEEP_MS=0 removes the simulated work, e.g. to benchmark the pipeline.
+    raw = os.getenv("MODEL_SERVICE_STUB_SLEEP_MS")
+    if raw is None:
+        return 0.01
+    try:
+        value = float(raw)
+    except (TypeError, ValueError):
+        return 0.01
+    return value / 1000.0 if value >= 0 else 0.01
+
+
 class StubAdapter:
     """
     Intentionally boring: deterministic, fast, and test-friendly.
     Swap this with a real adapter later.
     """
 
+    def __init__(self, sleep_s: float | None = None):
+        self.sleep_s = _sleep_s_from_env() if sleep_s is None else sleep_s
+
     @property
     def model_version(self) -> str:
         return "stub-1"
 
     def predict(self, x: InputContract) -> OutputContract:
         # Simulate tiny work
-        time.sleep(0.01)
+        if self.sleep_s:
+            time.sleep(self.sleep_s)
         # "Inference": reverse + pretend score
         out = x.text[::-1]
         score = min(1.0, len(x.text) / 100.0)
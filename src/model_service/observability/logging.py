@@ -7,7 +7,8 @@ def get_logger(name: str = "model_service") -> logging.Logger:
     logger = logging.getLogger(name)
     if not logger.handlers:
         handler = logging.StreamHandler()
-        fmt = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
+        # %(created) is already on the record; asctime would run localtime + strftime per line.
+        fmt = logging.Formatter("%(created).3f | %(levelname)s | %(message)s")
         handler.setFormatter(fmt)
         logger.addHandler(handler)
         logger.setLevel(logging.INFO)
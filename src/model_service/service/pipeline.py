@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 import random
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-from contextlib import contextmanager
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
 from model_service.config import AdapterRuntimeSettings
 
@@ -14,6 +17,20 @@ from model_service.observability.logging import get_logger
 
 log = get_logger()
 
+# Shared by every run() call: only used to put a deadline on model.predict, so threads are
+# reused instead of spawning (and joining) a fresh pool per prediction. Workers start lazily.
+#
+# This pool is deliberately not a limiter. Concurrency is bounded in two levels: callers
+# bound their own in-flight run() calls (evaluate's workers/bursts), and max_concurrency
+# bounds calls per adapter. If this pool were the tighter bound, calls would queue here
+# and the queue wait would count against timeout_s.
+#
+# A timeout abandons a call but can't interrupt it. concurrent.futures joins its worker
+# threads at interpreter shutdown, so process exit still waits for any predict() that is
+# running past its timeout (e.g. a timed-out CLI predict exits once the model call returns).
+_PREDICT_WORKERS = 1024
+_executor = ThreadPoolExecutor(max_workers=_PREDICT_WORKERS, thread_name_prefix="predict")
+
 
 def _fallback(model_version: str, err: str, latency_ms: float) -> OutputContract:
     # predictable, contract-valid output
@@ -26,13 +43,49 @@ def _fallback(model_version: str, err: str, latency_ms: float) -> OutputContract
     )
 
 
+_RESPONSE_CACHE_SIZE = 8192
+_response_cache_lock = threading.Lock()
+_response_cache: OrderedDict[tuple[str, bytes], OutputContract] = OrderedDict()
+
+
+def _cache_key(model_version: str, x: InputContract) -> tuple[str, bytes]:
+    digest = hashlib.blake2b(x.model_dump_json().encode("utf-8"), digest_size=16).digest()
+    return model_version, digest
+
+
+def _cache_get(key: tuple[str, bytes]) -> OutputContract | None:
+    with _response_cache_lock:
+        y = _response_cache.get(key)
+        if y is not None:
+            _response_cache.move_to_end(key)
+        return y
+
+
+def _cache_put(key: tuple[str, bytes], y: OutputContract) -> None:
+    with _response_cache_lock:
+        _response_cache[key] = y
+        _response_cache.move_to_end(key)
+        if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+
 _controls_lock = threading.Lock()
-_controls: dict[int, "_AdapterControl"] = {}
+# Keyed by id() and matched by identity, so adapters that compare equal (e.g. frozen
+# dataclasses with the same fields) still get their own limits. Entries hold a weak
+# reference to the adapter and are dropped when it is collected.
+_controls: dict[int, tuple[weakref.ref[ModelAdapter], _AdapterControl]] = {}
+# Adapters that can't be weakly referenced keep a strong reference instead, so their id
+# can't be reused while the entry exists; the oldest entries are dropped past
+# _CONTROLS_BY_ID_SIZE so the table doesn't grow without bound.
+_CONTROLS_BY_ID_SIZE = 256
+_controls_by_id: dict[int, tuple[ModelAdapter, _AdapterControl]] = {}
 
 
 class _AdapterControl:
-    def __init__(self, settings: AdapterRuntimeSettings):
+    def __init__(self, settings: AdapterRuntimeSettings, model_version: str = "unknown"):
         self.settings = settings
+        # Resolved once per adapter rather than through the property on every call.
+        self.model_version = model_version
         self._sem = (
             threading.BoundedSemaphore(settings.max_concurrency)
             if settings.max_concurrency
@@ -43,44 +96,82 @@ class _AdapterControl:
         self._last_refill = time.perf_counter()
         self._lock = threading.Lock()
 
-    @contextmanager
-    def concurrent_slot(self):
+    def submit(self, fn, *args) -> Future:
+        # Holds a concurrency slot for as long as the call actually runs, including past
+        # a caller-side timeout, so abandoned calls still count against max_concurrency.
         if self._sem is None:
-            yield
-            return
+            return _executor.submit(fn, *args)
         self._sem.acquire()
         try:
-            yield
-        finally:
+            fut = _executor.submit(fn, *args)
+        except BaseException:
             self._sem.release()
+            raise
+        fut.add_done_callback(lambda _: self._sem.release())
+        return fut
 
     def wait_rate_limit(self):
         if not self._rate_limit:
             return
-        while True:
-            with self._lock:
-                now = time.perf_counter()
-                elapsed = now - self._last_refill
-                self._last_refill = now
-                self._tokens = min(
-                    self._rate_limit, self._tokens + elapsed * self._rate_limit
-                )
-                if self._tokens >= 1.0:
-                    self._tokens -= 1.0
-                    return
-                deficit = 1.0 - self._tokens
-                wait = deficit / self._rate_limit
-            time.sleep(wait)
+        # Reservation-style token bucket: each caller refills and takes its token in one
+        # short critical section (the balance may go negative), then sleeps off its own
+        # deficit outside the lock. No re-locking loop, and waiters are served in order.
+        with self._lock:
+            now = time.perf_counter()
+            self._tokens = min(
+                self._rate_limit, self._tokens + (now - self._last_refill) * self._rate_limit
+            )
+            self._last_refill = now
+            self._tokens -= 1.0
+            deficit = -self._tokens
+        if deficit > 0:
+            time.sleep(deficit / self._rate_limit)
 
 
-def _get_controls(settings: AdapterRuntimeSettings, model: ModelAdapter) -> _AdapterControl:
+def _lookup_controls(model: ModelAdapter) -> _AdapterControl | None:
     key = id(model)
+    entry = _controls.get(key)
+    if entry is not None and entry[0]() is model:
+        return entry[1]
+    entry = _controls_by_id.get(key)
+    # A matching id alone may belong to an adapter that has since been collected.
+    if entry is not None and entry[0] is model:
+        return entry[1]
+    return None
+
+
+def _drop_controls(key: int, ref: weakref.ref) -> None:
+    # Weakref callback; runs at collection time, before the id can be handed out again.
+    entry = _controls.get(key)
+    if entry is not None and entry[0] is ref:
+        _controls.pop(key, None)
+
+
+def _store_controls(model: ModelAdapter, ctl: _AdapterControl) -> None:
+    key = id(model)
+    try:
+        ref = weakref.ref(model, lambda r: _drop_controls(key, r))
+    except TypeError:
+        _controls_by_id.pop(key, None)
+        _controls_by_id[key] = (model, ctl)
+        while len(_controls_by_id) > _CONTROLS_BY_ID_SIZE:
+            del _controls_by_id[next(iter(_controls_by_id))]
+        return
+    _controls[key] = (ref, ctl)
+
+
+def _get_controls(settings: AdapterRuntimeSettings, model: ModelAdapter) -> _AdapterControl:
+    ctl = _lookup_controls(model)
+    # Lock-free on the hot path; the lock only serializes (re)creation so concurrent
+    # first calls can't end up with separate semaphores / token buckets.
+    if ctl is not None and (ctl.settings is settings or ctl.settings == settings):
+        return ctl
     with _controls_lock:
-        ctl = _controls.get(key)
-        if ctl and ctl.settings == settings:
+        ctl = _lookup_controls(model)
+        if ctl is not None and ctl.settings == settings:
             return ctl
-        ctl = _AdapterControl(settings)
-        _controls[key] = ctl
+        ctl = _AdapterControl(settings, getattr(model, "model_version", "unknown"))
+        _store_controls(model, ctl)
         return ctl
 
 
@@ -96,26 +187,65 @@ def run(
     - contract-valid outputs always
     - safe fallback on failure
     """
-    start = time.perf_counter()
+    runtime = runtime_settings or AdapterRuntimeSettings()
+    return _run(model, x, timeout_s, runtime, _get_controls(runtime, model))
+
+
+def run_batch(
+    model: ModelAdapter,
+    xs: Iterable[InputContract],
+    timeout_s: float,
+    runtime_settings: AdapterRuntimeSettings | None = None,
+) -> list[OutputContract]:
+    """
+    Same guarantees as run(), applied to each input in order.
+    Settings and adapter controls are resolved once for the whole batch.
+    """
     runtime = runtime_settings or AdapterRuntimeSettings()
     controls = _get_controls(runtime, model)
-    mv = getattr(model, "model_version", "unknown")
+    return [_run(model, x, timeout_s, runtime, controls) for x in xs]
+
+
+def _run(
+    model: ModelAdapter,
+    x: InputContract,
+    timeout_s: float,
+    runtime: AdapterRuntimeSettings,
+    controls: _AdapterControl,
+) -> OutputContract:
+    start = time.perf_counter()
+    mv = controls.model_version
+
+    # Opt-in memoization for deterministic adapters. Hits return the stored output,
+    # including the latency_ms recorded when it was first computed.
+    cache_key = _cache_key(mv, x) if runtime.cache_enabled else None
+    if cache_key is not None:
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
 
     attempt = 0
     while attempt < max(1, runtime.retry_attempts):
         attempt += 1
         err: str | None = None
         controls.wait_rate_limit()
+        fut: Future | None = None
         try:
-            with controls.concurrent_slot():
-                with ThreadPoolExecutor(max_workers=1) as ex:
-                    fut = ex.submit(model.predict, x)
-                    y = fut.result(timeout=timeout_s)
+            fut = controls.submit(model.predict, x)
+            y = fut.result(timeout=timeout_s)
 
             latency_ms = (time.perf_counter() - start) * 1000
-            return y.model_copy(update={"latency_ms": latency_ms})
+            # Adapters hand back a fresh contract per call, so stamp it in place
+            # rather than copying the whole model.
+            y.latency_ms = latency_ms
+            if cache_key is not None:
+                _cache_put(cache_key, y)
+            return y
 
         except FuturesTimeoutError:
+            # Don't wait for the abandoned call; drop it if it never started.
+            if fut is not None:
+                fut.cancel()
             err = f"timeout after {timeout_s:.2f}s"
             log.info("timeout: model call exceeded %.2fs", timeout_s)
         except Exception as e:  # noqa: BLE001 (intentional boundary)
@@ -126,6 +256,6 @@ def run(
             latency_ms = (time.perf_counter() - start) * 1000
             return _fallback(mv, err or "unknown error", latency_ms)
 
-        backoff = max(0.0, runtime.retry_backoff_base_s) * (2 ** (attempt - 1))
-        jitter = random.uniform(0.0, max(0.0, runtime.retry_jitter_s))
+        backoff = max(0.0, runtime.retry_backoff_base_s) * (1 << (attempt - 1))
+        jitter = random.random() * max(0.0, runtime.retry_jitter_s)
         time.sleep(backoff + jitter)
@@ -0,0 +1,60 @@
+import io
+import json
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import pytest
+
+from model_service.cli import main
+
+DATASETS = Path(__file__).resolve().parents[1] / "src" / "model_service" / "eval" / "datasets"
+
+
+def test_predict_emits_contract_json(capsys):
+    assert main(["predict", "--text", "héllo"]) == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["ok"] is True
+    assert payload["output_text"] == "olléh"
+
+
+def test_predict_writes_to_text_only_stdout():
+    out = io.StringIO()
+    with redirect_stdout(out):
+        assert main(["predict", "--text", "héllo"]) == 0
+    assert json.loads(out.getvalue())["output_text"] == "olléh"
+
+
+def test_validate_exit_code_reflects_quality(capsys):
+    assert main(["validate", "--dataset", str(DATASETS / "invalid_language.jsonl")]) == 2
+    report = json.loads(capsys.readouterr().out)["dataset_quality"]
+    assert report["invalid_rows"] == 2
+
+
+def test_unknown_adapter_exits(monkeypatch):
+    monkeypatch.setenv("MODEL_SERVICE_ADAPTER", "nope")
+    with pytest.raises(SystemExit, match="Unknown adapter"):
+        main(["predict", "--text", "hi"])
+
+
+@pytest.mark.parametrize("flag", ["--concurrency", "--burst-size"])
+@pytest.mark.parametrize("value", ["0", "-1"])
+def test_eval_rejects_non_positive_sizes(capsys, flag, value):
+    with pytest.raises(SystemExit) as exc:
+        main(["eval", "--dataset", str(DATASETS / "tiny.jsonl"), flag, value])
+    assert exc.value.code == 2
+    assert "must be a positive integer" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    ("flag", "value", "message"),
+    [
+        ("--stop-min-samples", "0", "must be a positive integer"),
+        ("--stop-success-rate", "1.5", "must be between 0 and 1"),
+        ("--stop-success-rate", "-0.1", "must be between 0 and 1"),
+    ],
+)
+def test_eval_rejects_invalid_stop_conditions(capsys, flag, value, message):
+    with pytest.raises(SystemExit) as exc:
+        main(["eval", "--dataset", str(DATASETS / "tiny.jsonl"), flag, value])
+    assert exc.value.code == 2
+    assert message in capsys.readouterr().err
@@ -4,7 +4,8 @@ from model_service.config import AdapterRuntimeSettings, load_settings
 def test_adapter_settings_env_parses_overrides(monkeypatch):
     env_payload = (
         '{"stub":{"max_concurrency":3,"rate_limit_per_second":2.5,'
-        '"retry_attempts":4,"retry_backoff_base_s":0.2,"retry_jitter_s":0.1},"bad":"oops"}'
+        '"retry_attempts":4,"retry_backoff_base_s":0.2,"retry_jitter_s":0.1,'
+        '"cache_enabled":true},"bad":"oops"}'
     )
     monkeypatch.setenv("MODEL_SERVICE_ADAPTER_SETTINGS", env_payload)
     settings = load_settings()
@@ -15,6 +16,7 @@ def test_adapter_settings_env_parses_overrides(monkeypatch):
         retry_attempts=4,
         retry_backoff_base_s=0.2,
         retry_jitter_s=0.1,
+        cache_enabled=True,
     )
 
 
@@ -34,3 +36,13 @@ def test_default_timeout_non_positive_env_uses_default(monkeypatch):
     monkeypatch.setenv("MODEL_SERVICE_TIMEOUT_S", "0")
     settings = load_settings()
     assert settings.default_timeout_s == 2.0
+
+
+def test_load_settings_cached_until_env_changes(monkeypatch):
+    monkeypatch.setenv("MODEL_SERVICE_ADAPTER_SETTINGS", '{"stub":{"max_concurrency":2}}')
+    first = load_settings()
+    assert load_settings() is first
+    monkeypatch.setenv("MODEL_SERVICE_ADAPTER_SETTINGS", '{"stub":{"max_concurrency":5}}')
+    second = load_settings()
+    assert second is not first
+    assert second.adapter_overrides["stub"].max_concurrency == 5
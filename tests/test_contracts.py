@@ -6,6 +6,7 @@ from model_service.contracts import (
     OUTPUT_SCHEMA_VERSION,
     OutputContract,
     coerce_input,
+    coerce_text_input,
     coerce_output,
 )
 
@@ -44,3 +45,11 @@ def test_output_contract_schema_version_enforced():
     assert y.schema_version == OUTPUT_SCHEMA_VERSION
     with pytest.raises(ValidationError):
         OutputContract.model_validate({"schema_version": "0.9", "model_version": "stub", "output_text": "ok"})
+
+
+def test_coerce_text_input_matches_validated_contract():
+    assert coerce_text_input("hi") == coerce_input({"text": "hi"})
+    with pytest.raises(ValueError):
+        coerce_text_input("")
+    with pytest.raises(ValueError):
+        coerce_text_input("x" * 10_001)
@@ -1,8 +1,69 @@
 from pathlib import Path
+import threading
+import time
+
 import pytest
 
+from model_service.config import AdapterRuntimeSettings
+from model_service.contracts import InputContract, OutputContract
 from model_service.model.stub import StubAdapter
-from model_service.eval.runner import DatasetQualityReport, evaluate, load_jsonl, validate_dataset
+from model_service.eval.runner import (
+    DatasetQualityReport,
+    StopConditions,
+    evaluate,
+    iter_jsonl,
+    load_jsonl,
+    validate_dataset,
+)
+
+
+class TrackingAdapter:
+    def __init__(self, sleep_s: float):
+        self.sleep_s = sleep_s
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    @property
+    def model_version(self) -> str:
+        return "tracking-1"
+
+    def predict(self, x: InputContract):
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.sleep_s)
+        with self.lock:
+            self.active -= 1
+        return OutputContract(model_version=self.model_version, output_text=x.text)
+
+
+class FailingAdapter:
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    @property
+    def model_version(self) -> str:
+        return "failing-1"
+
+    def predict(self, x: InputContract):
+        with self.lock:
+            self.calls += 1
+        raise RuntimeError("always")
+
+
+def _write_rows(path: Path, n: int) -> Path:
+    path.write_text(
+        "".join(
+            f'{{"text":"t{i}","language":"en","metadata":{{"id":"{i}","source":"t"}}}}\n'
+            for i in range(n)
+        ),
+        encoding="utf-8",
+    )
+    return path
 
 
 def test_evaluate_counts_rows(tmp_path: Path):
@@ -36,3 +97,95 @@ def test_evaluate_rejects_invalid_dataset(tmp_path: Path):
     ds.write_text('{"text":"hola","language":"es","metadata":{"id":"1","source":"t"}}\n', encoding="utf-8")
     with pytest.raises(ValueError, match="dataset failed quality checks"):
         evaluate(StubAdapter(), ds, timeout_s=1.0)
+
+
+@pytest.mark.parametrize("kwargs", [{"concurrency": 0}, {"burst_size": -1}])
+def test_evaluate_rejects_non_positive_sizes(tmp_path: Path, kwargs):
+    ds = tmp_path / "ok.jsonl"
+    ds.write_text('{"text":"hi","language":"en","metadata":{"id":"1","source":"t"}}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        evaluate(StubAdapter(), ds, timeout_s=1.0, **kwargs)
+
+
+def test_evaluate_stops_model_calls_after_invalid_row(tmp_path: Path):
+    ds = tmp_path / "bad.jsonl"
+    ds.write_text(
+        '{"text":"hola","language":"es","metadata":{"id":"1","source":"t"}}\n'
+        '{"text":"a","language":"en","metadata":{"id":"2","source":"t"}}\n'
+        '{"schema_version":"0.9","text":"b","language":"en","metadata":{"id":"3","source":"t"}}\n',
+        encoding="utf-8",
+    )
+    adapter = TrackingAdapter(sleep_s=0.0)
+    with pytest.raises(ValueError, match="2 invalid of 3"):
+        evaluate(adapter, ds, timeout_s=1.0)
+    assert adapter.calls == 0
+
+
+def test_evaluate_runs_rows_concurrently(tmp_path: Path):
+    ds = _write_rows(tmp_path / "d.jsonl", 4)
+    adapter = TrackingAdapter(sleep_s=0.05)
+    settings = AdapterRuntimeSettings(max_concurrency=4)
+    r = evaluate(adapter, ds, timeout_s=1.0, runtime_settings=settings)
+    assert r.total == 4
+    assert r.ok == 4
+    assert adapter.peak > 1
+
+
+def test_iter_jsonl_skips_blank_lines(tmp_path: Path):
+    ds = tmp_path / "d.jsonl"
+    ds.write_text('{"text":"a"}\n\n  \n{"text":"b"}', encoding="utf-8")
+    rows = iter_jsonl(ds)
+    assert next(rows) == {"text": "a"}
+    assert list(rows) == [{"text": "b"}]
+
+
+def test_evaluate_stops_early_below_success_rate(tmp_path: Path):
+    ds = _write_rows(tmp_path / "d.jsonl", 20)
+    adapter = FailingAdapter()
+    r = evaluate(
+        adapter,
+        ds,
+        timeout_s=1.0,
+        runtime_settings=AdapterRuntimeSettings(max_concurrency=1),
+        stop_conditions=StopConditions(success_rate_lt=0.5, min_samples=3),
+    )
+    assert r.stopped_early is True
+    assert r.total == 3
+    assert r.failed == 3
+    assert adapter.calls < 20
+
+
+def test_evaluate_bounds_in_flight_rows_by_burst_size(tmp_path: Path):
+    ds = _write_rows(tmp_path / "d.jsonl", 6)
+    adapter = TrackingAdapter(sleep_s=0.02)
+    r = evaluate(adapter, ds, timeout_s=1.0, concurrency=4, burst_size=2)
+    assert r.total == 6
+    assert r.ok == 6
+    assert adapter.peak <= 2
+
+
+def test_evaluate_early_stop_still_rejects_invalid_dataset(tmp_path: Path):
+    ds = _write_rows(tmp_path / "d.jsonl", 4)
+    with ds.open("a", encoding="utf-8") as f:
+        f.write('{"text":"hola","language":"es","metadata":{"id":"x","source":"t"}}\n')
+    with pytest.raises(ValueError, match="1 invalid of 5"):
+        evaluate(
+            FailingAdapter(),
+            ds,
+            timeout_s=1.0,
+            burst_size=1,
+            stop_conditions=StopConditions(success_rate_lt=0.5, min_samples=1),
+        )
+
+
+def test_validate_dataset_attributes_errors_per_row():
+    rows = [
+        {"text": "a", "language": "en", "metadata": {"id": "1", "source": "t"}},
+        {"schema_version": "0.9", "text": "b", "language": "en", "metadata": {"id": "2", "source": "t"}},
+        {"text": "c", "metadata": {"id": "3", "source": "t"}},
+        {"text": "d", "language": "en", "metadata": {"id": "4", "source": "t"}},
+    ]
+    report = validate_dataset(rows)
+    assert report.valid_rows == 2
+    assert report.schema_version_errors == 1
+    assert report.language_errors == 1
@@ -1,9 +1,64 @@
+import itertools
+import os
 import time
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import pytest
 
 from model_service.config import AdapterRuntimeSettings
 from model_service.contracts import InputContract, OutputContract
-from model_service.service.pipeline import run
+from model_service.service import pipeline
+from model_service.service.pipeline import run, run_batch
+
+# Multiplies every real sleep/timeout below. CI keeps 1.0 for scheduling margin;
+# e.g. PIPELINE_TEST_TIME_SCALE=0.2 for faster local runs.
+SCALE = float(os.environ.get("PIPELINE_TEST_TIME_SCALE", "1.0"))
+CALLER_POOL_SIZE = 48
+# Shared, never mutated by the pipeline; saves a validation pass per test.
+HELLO = InputContract(text="hello")
+
+
+class FakeClock:
+    """Virtual time for the pipeline: sleep() advances the clock and returns immediately."""
+
+    def __init__(self):
+        self.now = 0.0
+        self._lock = threading.Lock()
+
+    def perf_counter(self) -> float:
+        with self._lock:
+            return self.now
+
+    monotonic = perf_counter
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.now += max(0.0, seconds)
+
+
+@pytest.fixture(scope="module")
+def caller_pool():
+    # Caller threads are created once and reused by every threaded test in this module.
+    with ThreadPoolExecutor(max_workers=CALLER_POOL_SIZE, thread_name_prefix="caller") as pool:
+        yield pool
+
+
+@pytest.fixture
+def fake_clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(pipeline, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def response_cache(monkeypatch) -> OrderedDict:
+    # The response cache is process-wide; give each cache-enabled test an empty one.
+    cache = OrderedDict()
+    monkeypatch.setattr(pipeline, "_response_cache", cache)
+    return cache
 
 
 class BoomAdapter:
@@ -30,19 +85,75 @@ class SlowAdapter:
 
 class CountingAdapter:
     def __init__(self):
+        # next() on itertools.count is atomic under the GIL; retries call predict one at a time.
+        self._counter = itertools.count(1)
         self.calls = 0
-        self.lock = threading.Lock()
 
     @property
     def model_version(self) -> str:
         return "counting-1"
 
     def predict(self, x: InputContract):
-        with self.lock:
-            self.calls += 1
+        self.calls = next(self._counter)
         raise RuntimeError("always")
 
 
+class EchoCountingAdapter:
+    def __init__(self):
+        self.calls = 0
+
+    @property
+    def model_version(self) -> str:
+        return "echo-counting-1"
+
+    def predict(self, x: InputContract):
+        self.calls += 1
+        return OutputContract(model_version=self.model_version, output_text=x.text)
+
+
+class SlottedAdapter:
+    __slots__ = ("version",)
+
+    def __init__(self, version: str = "slotted-1"):
+        self.version = version
+
+    @property
+    def model_version(self) -> str:
+        return self.version
+
+    def predict(self, x: InputContract):
+        return OutputContract(model_version=self.model_version, output_text=f"from {self.version}")
+
+
+@dataclass(frozen=True)
+class FrozenAdapter:
+    model_version: str = "frozen-1"
+
+    def predict(self, x: InputContract):
+        return OutputContract(model_version=self.model_version, output_text=x.text)
+
+
+class RendezvousAdapter:
+    """Two calls only get past the barrier if they are inside predict() at the same time."""
+
+    def __init__(self, wait_s: float):
+        self.barrier = threading.Barrier(2)
+        self.wait_s = wait_s
+        self.met: list[bool] = []
+
+    @property
+    def model_version(self) -> str:
+        return "rendezvous-1"
+
+    def predict(self, x: InputContract):
+        try:
+            self.barrier.wait(timeout=self.wait_s)
+            self.met.append(True)
+        except threading.BrokenBarrierError:
+            self.met.append(False)
+        return OutputContract(model_version=self.model_version, output_text=x.text)
+
+
 class BlockingAdapter:
     def __init__(self, sleep_s: float):
         self.sleep_s = sleep_s
@@ -57,8 +168,7 @@ class BlockingAdapter:
 
 
 def test_pipeline_falls_back_on_error():
-    x = InputContract(text="hello")
-    y = run(BoomAdapter(), x, timeout_s=1.0)
+    y = run(BoomAdapter(), HELLO, timeout_s=1.0)
     assert y.ok is False
     assert "RuntimeError" in (y.error or "")
     assert y.output_text == ""
@@ -66,49 +176,118 @@ def test_pipeline_falls_back_on_error():
 
 
 def test_pipeline_timeout_with_retries_still_times_out():
-    x = InputContract(text="hello")
     settings = AdapterRuntimeSettings(retry_attempts=3, retry_backoff_base_s=0.01, retry_jitter_s=0.0)
-    y = run(SlowAdapter(sleep_s=0.2), x, timeout_s=0.05, runtime_settings=settings)
+    adapter = SlowAdapter(sleep_s=0.2 * SCALE)
+    y = run(adapter, HELLO, timeout_s=0.05 * SCALE, runtime_settings=settings)
     assert y.ok is False
     assert "timeout" in (y.error or "")
 
 
 def test_pipeline_retries_before_fallback():
-    x = InputContract(text="hello")
     adapter = CountingAdapter()
     settings = AdapterRuntimeSettings(retry_attempts=2, retry_backoff_base_s=0.0, retry_jitter_s=0.0)
-    y = run(adapter, x, timeout_s=0.05, runtime_settings=settings)
+    y = run(adapter, HELLO, timeout_s=0.05 * SCALE, runtime_settings=settings)
     assert y.ok is False
     assert adapter.calls == 2
 
 
-def test_pipeline_respects_concurrency_limit():
-    x = InputContract(text="hello")
-    adapter = BlockingAdapter(sleep_s=0.2)
-    settings = AdapterRuntimeSettings(max_concurrency=1)
-    results: list[InputContract] = []
+def test_pipeline_retry_backoff_is_exponential(fake_clock: FakeClock):
+    adapter = CountingAdapter()
+    settings = AdapterRuntimeSettings(retry_attempts=3, retry_backoff_base_s=0.5, retry_jitter_s=0.0)
+    run(adapter, HELLO, timeout_s=0.05 * SCALE, runtime_settings=settings)
+    assert adapter.calls == 3
+    assert fake_clock.now == pytest.approx(1.5)  # 0.5s + 1.0s, no real sleeping
+
+
+@pytest.mark.parametrize(("max_concurrency", "expect_met"), [(1, False), (None, True)])
+def test_pipeline_respects_concurrency_limit(caller_pool, max_concurrency, expect_met):
+    adapter = RendezvousAdapter(wait_s=0.1 * SCALE)
+    settings = AdapterRuntimeSettings(max_concurrency=max_concurrency)
 
     def _call():
-        results.append(run(adapter, x, timeout_s=1.0, runtime_settings=settings))
+        return run(adapter, HELLO, timeout_s=1.0 * SCALE, runtime_settings=settings)
 
-    start = time.perf_counter()
-    t1 = threading.Thread(target=_call)
-    t2 = threading.Thread(target=_call)
-    t1.start()
-    t2.start()
-    t1.join()
-    t2.join()
-    elapsed = time.perf_counter() - start
+    futures = [caller_pool.submit(_call) for _ in range(2)]
+    results = [f.result() for f in futures]
     assert len(results) == 2
-    assert elapsed >= 0.4  # ~0.2s per call serialized by semaphore
+    # Serialized by the semaphore, neither call can see the other at the barrier.
+    assert adapter.met == [expect_met, expect_met]
 
 
-def test_pipeline_respects_rate_limit():
-    x = InputContract(text="hello")
-    adapter = BlockingAdapter(sleep_s=0.01)
+def test_pipeline_respects_rate_limit(fake_clock: FakeClock):
+    adapter = BlockingAdapter(sleep_s=0.0)
     settings = AdapterRuntimeSettings(rate_limit_per_second=1.0, retry_jitter_s=0.0)
+    results = run_batch(adapter, [HELLO, HELLO], timeout_s=1.0, runtime_settings=settings)
+    assert [y.ok for y in results] == [True, True]
+    limiter = pipeline._get_controls(settings, adapter)
+    assert limiter._tokens == -1.0  # first call spent the only token, second reserved the next...
+    assert fake_clock.now == pytest.approx(1.0)  # ...and slept exactly one refill interval
+
+
+def test_pipeline_timeout_does_not_wait_for_abandoned_call():
     start = time.perf_counter()
-    run(adapter, x, timeout_s=1.0, runtime_settings=settings)
-    run(adapter, x, timeout_s=1.0, runtime_settings=settings)
+    y = run(SlowAdapter(sleep_s=0.5 * SCALE), HELLO, timeout_s=0.05 * SCALE)
     elapsed = time.perf_counter() - start
-    assert elapsed >= 1.0  # second call waits for token refill
+    assert y.ok is False
+    assert elapsed < 0.3 * SCALE
+
+
+def test_pipeline_cache_reuses_identical_predictions(response_cache: OrderedDict):
+    adapter = EchoCountingAdapter()
+    settings = AdapterRuntimeSettings(cache_enabled=True)
+    first = run(adapter, InputContract(text="hello"), timeout_s=1.0, runtime_settings=settings)
+    second = run(adapter, InputContract(text="hello"), timeout_s=1.0, runtime_settings=settings)
+    run(adapter, InputContract(text="other"), timeout_s=1.0, runtime_settings=settings)
+    assert adapter.calls == 2
+    assert second == first
+
+
+def test_pipeline_does_not_queue_calls_past_their_timeout(caller_pool):
+    # More concurrent callers than a cpu-sized pool would hold; none should time out waiting.
+    adapter = BlockingAdapter(sleep_s=0.2 * SCALE)
+
+    def _call():
+        return run(adapter, HELLO, timeout_s=0.35 * SCALE)
+
+    futures = [caller_pool.submit(_call) for _ in range(CALLER_POOL_SIZE)]
+    results = [f.result() for f in futures]
+    assert len(results) == CALLER_POOL_SIZE
+    assert all(y.ok for y in results)
+
+
+def test_pipeline_accepts_adapters_without_weakref_support():
+    y = run(SlottedAdapter(), HELLO, timeout_s=1.0)
+    assert y.ok is True
+    assert y.model_version == "slotted-1"
+
+
+def test_pipeline_ignores_stale_id_entry_for_slotted_adapter(response_cache: OrderedDict):
+    settings = AdapterRuntimeSettings(cache_enabled=True)
+    a, b = SlottedAdapter("A-1"), SlottedAdapter("B-1")
+    run(a, HELLO, timeout_s=1.0, runtime_settings=settings)
+    # Simulate b being allocated at a's address once a has been collected.
+    pipeline._controls_by_id[id(b)] = pipeline._controls_by_id.pop(id(a))
+    y = run(b, HELLO, timeout_s=1.0, runtime_settings=settings)
+    assert (y.model_version, y.output_text) == ("B-1", "from B-1")
+
+
+def test_pipeline_bounds_id_keyed_controls():
+    for i in range(pipeline._CONTROLS_BY_ID_SIZE + 10):
+        run(SlottedAdapter(f"v{i}"), HELLO, timeout_s=1.0)
+    assert len(pipeline._controls_by_id) <= pipeline._CONTROLS_BY_ID_SIZE
+
+
+def test_pipeline_keeps_equal_adapters_separate():
+    settings = AdapterRuntimeSettings(max_concurrency=1)
+    a, b = FrozenAdapter(), FrozenAdapter()
+    assert a == b
+    assert pipeline._get_controls(settings, a) is not pipeline._get_controls(settings, b)
+
+
+def test_pipeline_drops_controls_with_their_adapter():
+    adapter = FrozenAdapter()
+    key = id(adapter)
+    run(adapter, HELLO, timeout_s=1.0)
+    assert key in pipeline._controls
+    del adapter
+    assert key not in pipeline._controls
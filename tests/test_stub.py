@@ -0,0 +1,15 @@
+from model_service.contracts import InputContract
+from model_service.model.stub import StubAdapter
+
+
+def test_stub_reverses_text():
+    y = StubAdapter(sleep_s=0.0).predict(InputContract(text="abc"))
+    assert y.output_text == "cba"
+    assert y.model_version == "stub-1"
+
+
+def test_stub_sleep_can_be_disabled_from_env(monkeypatch):
+    monkeypatch.setenv("MODEL_SERVICE_STUB_SLEEP_MS", "0")
+    assert StubAdapter().sleep_s == 0.0
+    monkeypatch.setenv("MODEL_SERVICE_STUB_SLEEP_MS", "nope")
+    assert StubAdapter().sleep_s == 0.01